@@ -1,9 +1,17 @@
-from typing import (Any, ClassVar, Dict, Final,
-                    cast, List, Mapping, Optional,
-                    Sequence)
+import asyncio
+import copy
+import functools
+import math
+import time
+import weakref
+from operator import attrgetter
+from types import MappingProxyType
+from typing import (Any, ClassVar, Dict,
+                    List, Mapping, Optional,
+                    Sequence, Set, Tuple)
 
 from typing_extensions import Self
-from viam.components.sensor import *
+from viam.components.sensor import Sensor
 from viam.proto.app.robot import ComponentConfig
 from viam.proto.common import Geometry, ResourceName
 from viam.resource.base import ResourceBase
@@ -11,19 +19,272 @@ from viam.resource.easy_resource import EasyResource
 from viam.resource.types import Model, ModelFamily
 from viam.utils import SensorReading, ValueTypes
 from viam.services.vision import Vision
-from viam.components.camera import Camera
 
 
+# Config attribute names and the protobuf Value kinds they hold
+_F_VISION = "vision_service"
+_F_CAMERA = "camera_name"
+_F_POLL_INTERVAL = "poll_interval_s"
+_F_COALESCE_WINDOW = "coalesce_window_ms"
+_F_CACHE = "cache_ms"
+_F_MAX_STALE = "max_stale_ms"
+_F_BATCH_TICK = "batch_tick_ms"
+_F_DEFAULT_TIMEOUT = "default_timeout_ms"
+_F_STRING_VALUE = "string_value"
+_F_NUMBER_VALUE = "number_value"
+_REQUIRED_FIELDS = (_F_VISION, _F_CAMERA)
+
+# Optional numeric attributes and whether 0 is an allowed value
+_OPTIONAL_NUMBER_FIELDS = (
+    (_F_POLL_INTERVAL, True),
+    (_F_COALESCE_WINDOW, True),
+    (_F_CACHE, True),
+    (_F_MAX_STALE, False),
+    (_F_BATCH_TICK, True),
+    (_F_DEFAULT_TIMEOUT, False),
+)
+
+# Label that counts as a person detection. upb-backed Detection messages decode a new str 
+# on every class_name access and expose no raw bytes, so there is no identity or bytes fast 
+# path.
+_PERSON = "person"
+
+# Labels (lowercased) that count as a person detection
+_PERSON_LABELS = frozenset({_PERSON})
+
+_class_name = attrgetter("class_name")
+
+# Default seconds between background detection requests
+_DEFAULT_POLL_INTERVAL_S = 0.1
+
+# Default milliseconds during which concurrent on-demand readings share one request
+_DEFAULT_COALESCE_WINDOW_MS = 50.0
+
+# Default milliseconds an on-demand result is reused before querying again
+_DEFAULT_CACHE_MS = 100.0
+
+# Default milliseconds after which the last detection result is reported as stale. Unless 
+# `max_stale_ms` is set, this is raised to two poll cycles at the cadence the sensor actually 
+# achieves (poll interval plus the last request's duration), so results from a healthy but 
+# slow model are not reported stale between polls.
+_DEFAULT_MAX_STALE_MS = 1000.0
+
+# Default milliseconds a batch of detection requests stays open before it is sent
+_DEFAULT_BATCH_TICK_MS = 0.0
+
+
+def _number_attr(fields: Mapping[str, Any], name: str, default: Optional[float]) -> Optional[float]:
+    """
+        Returns the optional numeric attribute `name`, or `default` if it is unset. The value 
+        has already been checked by `validate_config`.
+    """
+    fv = fields.get(name)
+    if fv is None:
+        return default
+    return fv.number_value
+
+
+def _contains_person(detections: Sequence[Any]) -> bool:
+    """
+        Checks whether any detection is labelled as a person. The labels are pulled out, 
+        lowercased and tested lazily in C via `map` and `isdisjoint` rather than a Python-level 
+        loop, which matters for dense scenes with many detections, and the test stops at the 
+        first person found without building a list of every label.
+    """
+    return not _PERSON_LABELS.isdisjoint(map(str.lower, map(_class_name, detections)))
+
+
+def _copy_exception(e: Exception) -> Exception:
+    """
+        Returns a copy of `e` chained to the original, so that each waiter re-raises its own 
+        instance instead of growing the traceback of a shared one.
+    """
+    try:
+        err = copy.copy(e)
+    except Exception:
+        return e
+    err.__cause__ = e
+    return err
+
+
+class _BatchScheduler:
+    """
+        Coalesces detection requests from every sensor sharing a vision service, so that 
+        requests for the same camera within one batch tick are sent as a single request 
+        and the detections are fanned out to each waiting sensor. A batch is sent after the 
+        `batch_tick_ms` of the sensor that opened it; later sensors join without extending it.
+    """
+
+    _registry: ClassVar["weakref.WeakKeyDictionary[Vision, _BatchScheduler]"] = weakref.WeakKeyDictionary()
+
+    def __init__(self, vision_service: Vision):
+        # Weak so the registry entry does not keep the vision service alive
+        self._vision_ref = weakref.ref(vision_service)
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._timeouts: Dict[str, Optional[float]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Strong references to running requests so they are not garbage collected
+        self._tasks: Set[asyncio.Task] = set()
+
+    @classmethod
+    def for_service(cls, vision_service: Vision) -> "_BatchScheduler":
+        """
+            Returns the scheduler shared by all sensors using `vision_service`.
+        """
+        scheduler = cls._registry.get(vision_service)
+        if scheduler is None:
+            scheduler = cls(vision_service)
+            cls._registry[vision_service] = scheduler
+        return scheduler
+
+    def get_detections(self, camera_name: str, tick: float, timeout: Optional[float]) -> asyncio.Future:
+        """
+            Queues a detection request for `camera_name` in the current batch, opening a new 
+            batch that is sent after `tick` seconds if none is pending. The request for each 
+            camera is sent with the longest `timeout` of its waiters, or none if any waiter 
+            has no timeout.
+
+            Returns:
+                asyncio.Future: Resolves to the detections for `camera_name`.
+        """
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        waiters = self._pending.get(camera_name)
+        if waiters is None:
+            self._pending[camera_name] = [waiter]
+            self._timeouts[camera_name] = timeout
+        else:
+            waiters.append(waiter)
+            current = self._timeouts[camera_name]
+            if current is not None:
+                self._timeouts[camera_name] = None if timeout is None else max(timeout, current)
+
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(tick, self._flush)
+
+        return waiter
+
+    def _flush(self):
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        timeouts, self._timeouts = self._timeouts, {}
+
+        # One request per unique camera in the batch, skipping waiters that already gave up
+        for camera_name, waiters in pending.items():
+            waiters = [waiter for waiter in waiters if not waiter.done()]
+            if not waiters:
+                continue
+
+            task = asyncio.ensure_future(self._fetch(camera_name, waiters, timeouts[camera_name]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+            cancel_if_abandoned = functools.partial(self._cancel_if_abandoned, task, waiters)
+            for waiter in waiters:
+                waiter.add_done_callback(cancel_if_abandoned)
+
+    @staticmethod
+    def _cancel_if_abandoned(task: asyncio.Task, waiters: List[asyncio.Future], _waiter: asyncio.Future):
+        # Every sensor waiting on this request was cancelled (e.g. closed or timed out)
+        if not task.done() and all(waiter.cancelled() for waiter in waiters):
+            task.cancel()
+
+    async def _fetch(self, camera_name: str, waiters: List[asyncio.Future], timeout: Optional[float]):
+        try:
+            vision_service = self._vision_ref()
+            if vision_service is None:
+                raise RuntimeError("Vision service is no longer available.")
+            detections = await vision_service.get_detections_from_camera(camera_name, timeout=timeout)
+        except asyncio.CancelledError:
+            for waiter in waiters:
+                waiter.cancel()
+            raise
+        except Exception as e:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(_copy_exception(e))
+            return
+
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(detections)
+
 
 class PersonSensor(Sensor, EasyResource):
     MODEL: ClassVar[Model] = Model(
         ModelFamily("anazen", "simple-person-sensor"), "person-sensor"
     )
 
+    # The base classes still provide a __dict__, but our own attributes use slot access
+    __slots__ = (
+        "camera_name",
+        "vision_service",
+        "_vision_service_name",
+        "_get_detections",
+        "_cam",
+        "_batch_tick",
+        "_detection_ok",
+        "_capability_task",
+        "_vision_rn_cache",
+        "_latest",
+        "_max_stale_s",
+        "_last_request_s",
+        "_poll_interval",
+        "_producer_task",
+        "_inflight",
+        "_inflight_deadline",
+        "_generation",
+        "_coalesce_window",
+        "_cache_s",
+        "_default_timeout",
+    )
+
+    # Read-only readings shared across calls, since there are only a few possible results
+    _RESULT_TRUE: ClassVar[Mapping[str, SensorReading]] = MappingProxyType(
+        {"person_detected": 1, "person_detected_stale": 0}
+    )
+    _RESULT_FALSE: ClassVar[Mapping[str, SensorReading]] = MappingProxyType(
+        {"person_detected": 0, "person_detected_stale": 0}
+    )
+    _RESULT_STALE: ClassVar[Mapping[str, SensorReading]] = MappingProxyType(
+        {"person_detected": 0, "person_detected_stale": 1}
+    )
+
     def __init__(self, name: str):
         super().__init__(name=name)
         self.camera_name = None
         self.vision_service = None
+        self._vision_service_name = None
+
+        # Bound detection method and camera name, resolved once per reconfigure
+        self._get_detections = None
+        self._cam = None
+        self._batch_tick = _DEFAULT_BATCH_TICK_MS / 1000
+        self._default_timeout: Optional[float] = None
+
+        # Whether the vision service supports detections, checked once per reconfigure
+        self._detection_ok: bool = True
+        self._capability_task: Optional[asyncio.Task] = None
+
+        # ResourceName keys are protobuf messages, so cache them per service name
+        self._vision_rn_cache: dict[str, ResourceName] = {}
+
+        # Monotonic time and value of the last successful detection, read by get_readings
+        self._latest: Tuple[float, int] = (0.0, 0)
+        # Bumped on every reconfigure so requests from an older config never store results
+        self._generation: int = 0
+        # Explicit `max_stale_ms` in seconds, or None to follow the achieved poll cadence
+        self._max_stale_s: Optional[float] = None
+        # Duration of the last successful detection request, in seconds
+        self._last_request_s: float = 0.0
+        self._poll_interval = _DEFAULT_POLL_INTERVAL_S
+        self._producer_task: Optional[asyncio.Task] = None
+
+        # In-flight on-demand detection shared by concurrent get_readings callers
+        self._inflight: Optional[asyncio.Future] = None
+        self._inflight_deadline: float = 0.0
+        self._coalesce_window = _DEFAULT_COALESCE_WINDOW_MS / 1000
+        self._cache_s = _DEFAULT_CACHE_MS / 1000
 
     @classmethod
     def new(
@@ -47,7 +308,11 @@ class PersonSensor(Sensor, EasyResource):
         This method ensures that the required configuration fields (`camera_name` 
         and `vision_service`) are present and valid, and checks their data types 
         (string values). It will raise an exception if any required fields are missing 
-        or if they are of an incorrect type. It returns a list of implicit dependencies 
+        or if they are of an incorrect type. Optional numeric fields, if present, must be 
+        finite numbers that are not negative (`max_stale_ms` and `default_timeout_ms` 
+        must also be greater than 0), and `max_stale_ms` must exceed the poll interval 
+        plus `default_timeout_ms` when the background loop runs. An explicit `max_stale_ms` 
+        must also exceed the model's inference time, which cannot be checked here. It returns a list of implicit dependencies 
         that are needed for the sensor component to function.
 
         Args:
@@ -61,26 +326,53 @@ class PersonSensor(Sensor, EasyResource):
             TypeError: If any configuration fields have incorrect data types (e.g., 
                     non-string values for `camera_name` or `vision_service`).
             Exception: If any required configuration fields have empty values.            
+            ValueError: If any optional numeric fields are not numbers or are out of range.
         """
         # Validate required fields 
-        required_fields = ["vision_service", "camera_name"]
+        fields = config.attributes.fields
         dependencies = []
 
         # Validate each required field and store values in dependencies
-        for field in required_fields:
-            field_value = config.attributes.fields.get(field)
+        for name in _REQUIRED_FIELDS:
+            fv = fields.get(name)
             
             # Both expected values are strings 
-            if not field_value or not field_value.HasField("string_value"):
-                raise ValueError(f"'{field}' attribute is missing or not a valid string.")
+            if fv is None or fv.WhichOneof("kind") != _F_STRING_VALUE:
+                raise ValueError(f"'{name}' attribute is missing or not a valid string.")
             
-            field_value = field_value.string_value
+            sv = fv.string_value
             
-            if not field_value:
-                raise ValueError(f"'{field}' attribute cannot be an empty string.")
+            if not sv:
+                raise ValueError(f"'{name}' attribute cannot be an empty string.")
             
             # Add to dependencies
-            dependencies.append(field_value)
+            dependencies.append(sv)
+
+        # Validate optional numeric fields, which fall back to defaults only when unset
+        for name, allow_zero in _OPTIONAL_NUMBER_FIELDS:
+            fv = fields.get(name)
+            if fv is None:
+                continue
+
+            if fv.WhichOneof("kind") != _F_NUMBER_VALUE or not math.isfinite(fv.number_value):
+                raise ValueError(f"'{name}' attribute must be a number.")
+
+            nv = fv.number_value
+            if nv < 0 or (nv == 0 and not allow_zero):
+                bound = "0 or greater" if allow_zero else "greater than 0"
+                raise ValueError(f"'{name}' attribute must be {bound}.")
+
+        # A result must be able to outlive the wait for the next poll, or it reads as stale 
+        # for part of every poll cycle even when the vision service is healthy
+        max_stale_ms = _number_attr(fields, _F_MAX_STALE, None)
+        poll_interval_ms = _number_attr(fields, _F_POLL_INTERVAL, _DEFAULT_POLL_INTERVAL_S) * 1000
+        if max_stale_ms is not None and poll_interval_ms > 0:
+            limit_ms = poll_interval_ms + (_number_attr(fields, _F_DEFAULT_TIMEOUT, None) or 0.0)
+            if max_stale_ms <= limit_ms:
+                raise ValueError(
+                    f"'{_F_MAX_STALE}' attribute must be greater than the poll interval plus "
+                    f"'{_F_DEFAULT_TIMEOUT}' ({limit_ms:g} ms)."
+                )
 
         # Now dependencies list contains both camera_name and vision_service
         return dependencies
@@ -102,27 +394,164 @@ class PersonSensor(Sensor, EasyResource):
                                                                 resource, that are required 
                                                                 for reconfiguration.
             
+            The optional `poll_interval_s` attribute sets how often the background detection 
+            loop queries the vision service; a value of 0 disables the loop so that 
+            `get_readings` queries the vision service on demand. Any running loop is cancelled 
+            and restarted against the new configuration. The optional `coalesce_window_ms` 
+            attribute sets how long concurrent on-demand readings may share one request, 
+            `cache_ms` sets how long an on-demand result is reused without a new request, 
+            `max_stale_ms` sets how old the last result may be before it is reported as stale, and 
+            `batch_tick_ms` sets how long requests from sensors sharing the vision service are 
+            collected before being sent together. `default_timeout_ms` bounds each detection 
+            request when no timeout is given; if it is unset, requests wait as long as the 
+            vision service needs.
+
+            The vision service properties are checked once in the background, and the sensor 
+            reports a stale reading without querying for detections if it does not support them.
+
             Logs:
                 - Logs an info message when the reconfiguration process starts.
         """
 
         # Get camera_name and vision_service_name from config
-        camera_name = config.attributes.fields["camera_name"].string_value
-        vision_service_name = config.attributes.fields["vision_service"].string_value
+        fields = config.attributes.fields
+        camera_name = fields[_F_CAMERA].string_value
+        vision_service_name = fields[_F_VISION].string_value
+
+        # Get the vision_service from dependencies, reusing the cached resource name
+        vision_rn = self._vision_rn_cache.get(vision_service_name)
+        if vision_rn is None:
+            vision_rn = Vision.get_resource_name(vision_service_name)
+            self._vision_rn_cache[vision_service_name] = vision_rn
 
-        # Get the vision_service from dependencies
-        vision_service_resource = dependencies[Vision.get_resource_name(vision_service_name)]
-        vision_service = cast(Vision, vision_service_resource)
+        # Annotation only; the dependency is already the vision service client
+        vision_service: Vision = dependencies[vision_rn]  # type: ignore[assignment]
 
         # Set dependencies 
         self.vision_service = vision_service
+        self._vision_service_name = vision_service_name
 
         # Set camera name for get_detections_from_camera later
         # This is how we retrieve the detections to set the sensor readings 
         self.camera_name = camera_name
 
+        # Bind the detection call once so the detection path skips the attribute lookups.
+        # Requests go through the scheduler shared by all sensors using this vision service.
+        self._get_detections = _BatchScheduler.for_service(vision_service).get_detections
+        self._cam = camera_name
+
+        self._poll_interval = _number_attr(fields, _F_POLL_INTERVAL, _DEFAULT_POLL_INTERVAL_S)
+        self._coalesce_window = _number_attr(fields, _F_COALESCE_WINDOW, _DEFAULT_COALESCE_WINDOW_MS) / 1000
+        self._cache_s = _number_attr(fields, _F_CACHE, _DEFAULT_CACHE_MS) / 1000
+        self._batch_tick = _number_attr(fields, _F_BATCH_TICK, _DEFAULT_BATCH_TICK_MS) / 1000
+        default_timeout_ms = _number_attr(fields, _F_DEFAULT_TIMEOUT, None)
+        self._default_timeout = default_timeout_ms / 1000 if default_timeout_ms is not None else None
+
+        max_stale_ms = _number_attr(fields, _F_MAX_STALE, None)
+        self._max_stale_s = max_stale_ms / 1000 if max_stale_ms is not None else None
+        self._last_request_s = 0.0
+
+        # Check detection support up front instead of after every failed request
+        if self._capability_task is not None:
+            self._capability_task.cancel()
+        self._detection_ok = True
+        self._capability_task = asyncio.ensure_future(self._check_supports_detections())
+
+        # Restart the detection loop so it picks up the new camera and vision service
+        if self._producer_task is not None:
+            self._producer_task.cancel()
+            self._producer_task = None
+        if self._inflight is not None:
+            self._inflight.cancel()
+            self._inflight = None
+        self._generation += 1
+        self._latest = (0.0, 0)
+        if self._poll_interval > 0:
+            self._producer_task = asyncio.create_task(self._detection_loop())
+
         return super().reconfigure(config, dependencies)
 
+    async def _check_supports_detections(self):
+        """
+            Queries the vision service properties and records whether it supports detections.
+
+            Logs:
+                - A warning message if the properties could not be retrieved.
+                - An error message if the vision service does not support detection.
+        """
+        try:
+            properties = await self.vision_service.get_properties()
+        except Exception as e:
+            self.logger.warning("Could not retrieve vision service properties: %s", e)
+            return
+
+        self._detection_ok = properties.detections_supported
+        if not self._detection_ok:
+            self.logger.error(
+                "Vision service %s does not support detection. Vision service must support detection.",
+                self._vision_service_name,
+            )
+
+    async def _detection_loop(self):
+        """
+            Continuously queries the vision service and stores whether a person is in frame, 
+            so that `get_readings` never waits on the detection request itself.
+        """
+        while True:
+            await self._detect_person(self._default_timeout)
+            await asyncio.sleep(self._poll_interval)
+
+    async def _detect_person(self, timeout: Optional[float]):
+        """
+            Queries the vision service for detections from the configured camera and, on 
+            success, stores whether a person is in frame along with the time it was observed. 
+            Failed or timed out requests leave the previous result in place until it 
+            becomes stale.
+
+            Args:
+                timeout (Optional[float]): The maximum time, in seconds, to wait for the 
+                                        detections, or None to wait indefinitely.
+
+            Logs:
+                - A debug message indicating whether a person was detected or not.
+                - A warning message if the detection request times out.
+                - An error message if an exception occurs during the detection process.
+        """
+        if not self._detection_ok:
+            return
+
+        generation = self._generation
+        start = time.monotonic()
+
+        # confidence threshold set by external vision service
+        try:
+            detections = await asyncio.wait_for(
+                self._get_detections(self._cam, self._batch_tick, timeout), timeout=timeout
+            )
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self.logger.warning("Timed out after %ss waiting for detections.", timeout)
+            return
+        except Exception as e:
+            self.logger.error("Error retrieving detections: %s", e)
+            return
+
+        # The sensor was reconfigured while waiting; this result belongs to the old config
+        if generation != self._generation:
+            return
+
+        now = time.monotonic()
+        self._last_request_s = now - start
+
+        # a single instance of a person will trigger this sensor 
+        if _contains_person(detections):
+            self.logger.debug("Person detected.")
+            self._latest = (now, 1)
+        else:
+            self.logger.debug("No person detected.")
+            self._latest = (now, 0)
+
     async def get_readings(
         self,
         *,
@@ -131,64 +560,96 @@ class PersonSensor(Sensor, EasyResource):
         **kwargs
     ) -> Mapping[str, SensorReading]:
         """
-            Retrieves sensor readings by querying the vision service for detections from the 
-            configured camera. The method checks if a person is detected in the camera frame 
-            and returns a mapping with a boolean value indicating whether a person is present.
+            Retrieves sensor readings from the most recent result of the background detection 
+            loop. The method reports whether a person was detected in the camera frame and 
+            returns a mapping with a boolean value indicating whether a person is present.
 
-            The method communicates with the vision service to retrieve detection data, 
-            processes it to identify a "person" class, and logs the results.
+            The detection loop communicates with the vision service to retrieve detection data, 
+            processes it to identify a "person" class, and logs the results, so this method 
+            returns without waiting on the vision service. If the loop is disabled, the vision 
+            service is queried on demand, results younger than `cache_ms` are reused, and 
+            concurrent callers share a single request.
 
             Args:
                 extra (Optional[Mapping[str, Any]]): Additional parameters that can be passed 
                                                     with the request. Defaults to None.
-                timeout (Optional[float]): The maximum time, in seconds, to wait for the 
-                                        detection request to complete. Defaults to None.
+                timeout (Optional[float]): The maximum time, in seconds, to wait for an 
+                                        on-demand detection request to complete. Defaults 
+                                        to None, which uses `default_timeout_ms` if set and 
+                                        otherwise waits indefinitely.
                 **kwargs: Additional keyword arguments that may be passed to the method.
 
             Returns:
                 Mapping[str, SensorReading]: A dictionary where the key `"person_detected"` 
                                             maps to an integer (0 or 1), indicating whether 
-                                            a person was detected in the camera frame.
+                                            a person was detected in the camera frame, and 
+                                            `"person_detected_stale"` is 1 if the last result 
+                                            is older than `max_stale_ms` (in which case 
+                                            `"person_detected"` is 0).
 
-            Raises:
-                Exception: If an error occurs while retrieving the detections or if the 
-                        vision service does not support detection.
-
-            Logs:
-                - A debug message indicating whether a person was detected or not.
-                - An error message if an exception occurs during the detection process.
         """
-        
-        try:
-            person_in_frame = 0
+        # A vision service without detections can never give a trustworthy "no person"
+        if not self._detection_ok:
+            return self._RESULT_STALE
 
-            # confidence threshold set by external vision service
-            try: 
-                detections = await self.vision_service.get_detections_from_camera(self.camera_name)
-            except: 
-                # Check the properties of vision service if we fail for more thorough debugging 
-                properties = await self.vision_service.get_properties()
+        max_stale = self._max_stale_s
+        if max_stale is None:
+            # Allow two poll cycles at the cadence actually achieved, including inference time
+            max_stale = max(_DEFAULT_MAX_STALE_MS / 1000, 2 * (self._poll_interval + self._last_request_s))
 
-                # Check if the vision service supports detection methods
-                if not properties.detections_supported:
-                    raise Exception(f"Vision service {self.vision_service} does not support detection. Vision service must support detection.")
+        # Reuse the last on-demand result while it is younger than `cache_ms`, but never once 
+        # the staleness policy would reject it
+        if self._producer_task is None and time.monotonic() - self._latest[0] >= min(self._cache_s, max_stale):
+            await self._detect_person_coalesced(timeout if timeout is not None else self._default_timeout)
 
+        ts, person_in_frame = self._latest
+        if time.monotonic() - ts >= max_stale:
+            return self._RESULT_STALE
 
-            # a single instance of a person will trigger this sensor 
-            person_in_frame = 1 if any(d.class_name.lower() == "person" for d in detections) else 0
+        return self._RESULT_TRUE if person_in_frame else self._RESULT_FALSE
 
-            if person_in_frame:
-                self.logger.debug("Person detected.")
-    
-            else:
-                self.logger.debug("No person detected.")
-    
-        except Exception as e:
-            self.logger.error(f"Error retrieving detections: {e}")
+    async def _detect_person_coalesced(self, timeout: Optional[float]):
+        """
+            Runs an on-demand detection, sharing a single in-flight request between callers 
+            that arrive within `coalesce_window_ms` of it being issued. Each caller waits at 
+            most its own `timeout`, after which the last good result is used.
+        """
+        now = time.monotonic()
+        inflight = self._inflight
 
-        return {
-            "person_detected": person_in_frame
-        }
+        if inflight is None or inflight.done() or now >= self._inflight_deadline + self._coalesce_window:
+            inflight = asyncio.ensure_future(self._detect_person(timeout))
+            self._inflight = inflight
+            self._inflight_deadline = now
+
+        # Shield so one cancelled or timed out caller does not cancel the request for everyone 
+        # else, and bound the wait by this caller's own timeout since it may have joined a 
+        # request started with a longer one (or none)
+        try:
+            await asyncio.wait_for(asyncio.shield(inflight), timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning("Timed out after %ss waiting for detections.", timeout)
+        except asyncio.CancelledError:
+            # The request itself was cancelled by reconfigure or close; only re-raise if 
+            # this caller is the one being cancelled
+            if not inflight.cancelled():
+                raise
+
+    async def close(self):
+        """
+            Stops the background detection loop, any in-flight on-demand detection and any 
+            pending properties check.
+        """
+        if self._producer_task is not None:
+            self._producer_task.cancel()
+            self._producer_task = None
+        if self._inflight is not None:
+            self._inflight.cancel()
+            self._inflight = None
+        if self._capability_task is not None:
+            self._capability_task.cancel()
+            self._capability_task = None
+        self._generation += 1
 
 
     async def do_command(
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# run.sh starts the module with `python -m src.main` from this directory, so import it the same way
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -0,0 +1,51 @@
+import asyncio
+
+from viam.proto.app.robot import ComponentConfig
+from viam.proto.service.vision import Detection
+from viam.services.vision import Vision
+from viam.utils import dict_to_struct
+
+from src.models.person_sensor import PersonSensor
+
+
+class FakeVision:
+    """Stands in for a vision service client, counting and optionally delaying requests."""
+
+    def __init__(self, label="person", delay=0.0, error=None, detections_supported=True):
+        self.label = label
+        self.delay = delay
+        self.error = error
+        self.detections_supported = detections_supported
+        self.calls = 0
+        self.cancelled = 0
+        self.timeouts = []
+
+    async def get_detections_from_camera(self, camera_name, *, timeout=None, **kwargs):
+        self.calls += 1
+        self.timeouts.append(timeout)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return [Detection(class_name="dog"), Detection(class_name=self.label)]
+
+    async def get_properties(self, **kwargs):
+        class Properties:
+            detections_supported = self.detections_supported
+        return Properties()
+
+
+def make_config(**attributes):
+    attributes = {"camera_name": "cam", "vision_service": "vision", **attributes}
+    return ComponentConfig(name="sensor", attributes=dict_to_struct(attributes))
+
+
+def make_sensor(vision, **attributes):
+    return PersonSensor.new(make_config(**attributes), {Vision.get_resource_name("vision"): vision})
+
+
+def reading(readings):
+    return readings["person_detected"], readings["person_detected_stale"]
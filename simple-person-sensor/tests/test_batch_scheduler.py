@@ -0,0 +1,46 @@
+import asyncio
+
+from helpers import FakeVision, make_sensor
+from src.models.person_sensor import _BatchScheduler
+
+
+def test_close_cancels_background_request():
+    async def run():
+        vision = FakeVision(delay=10)
+        sensor = make_sensor(vision)
+        await asyncio.sleep(0.05)
+        await sensor.close()
+        await asyncio.sleep(0.01)
+        return vision, _BatchScheduler.for_service(vision)
+
+    vision, scheduler = asyncio.run(run())
+    assert vision.cancelled == 1
+    assert not scheduler._tasks
+
+
+def test_batch_sends_one_request_per_camera():
+    async def run():
+        vision = FakeVision(delay=0.01)
+        scheduler = _BatchScheduler.for_service(vision)
+        waiters = [scheduler.get_detections(cam, 0, None) for cam in ("a", "a", "b", "a")]
+        results = await asyncio.gather(*waiters)
+        return vision, results
+
+    vision, results = asyncio.run(run())
+    assert vision.calls == 2
+    assert results[0] is results[1] is results[3]
+
+
+def test_batch_fans_out_errors_as_separate_exceptions():
+    async def run():
+        error = RuntimeError("vision service down")
+        vision = FakeVision(error=error)
+        scheduler = _BatchScheduler.for_service(vision)
+        waiters = [scheduler.get_detections("cam", 0, None) for _ in range(3)]
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        return vision, error, results
+
+    vision, error, results = asyncio.run(run())
+    assert vision.calls == 1
+    assert all(isinstance(r, RuntimeError) and r.__cause__ is error for r in results)
+    assert len({id(r) for r in results}) == 3
@@ -0,0 +1,35 @@
+import asyncio
+
+from helpers import FakeVision, make_sensor, reading
+
+
+def test_on_demand_result_is_reused_for_cache_ms():
+    async def run():
+        vision = FakeVision()
+        sensor = make_sensor(vision, poll_interval_s=0, cache_ms=100)
+        await sensor.get_readings()
+        await sensor.get_readings()
+        cached_calls = vision.calls
+        await asyncio.sleep(0.15)
+        await sensor.get_readings()
+        await sensor.close()
+        return cached_calls, vision.calls
+
+    cached_calls, calls = asyncio.run(run())
+    assert cached_calls == 1
+    assert calls == 2
+
+
+def test_stale_cached_result_is_refreshed():
+    async def run():
+        vision = FakeVision()
+        sensor = make_sensor(vision, poll_interval_s=0, cache_ms=3000, max_stale_ms=100)
+        await sensor.get_readings()
+        await asyncio.sleep(0.15)
+        readings = await sensor.get_readings()
+        await sensor.close()
+        return vision, readings
+
+    vision, readings = asyncio.run(run())
+    assert vision.calls == 2
+    assert reading(readings) == (1, 0)
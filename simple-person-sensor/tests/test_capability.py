@@ -0,0 +1,17 @@
+import asyncio
+
+from helpers import FakeVision, make_sensor, reading
+
+
+def test_unsupported_vision_service_reports_stale_without_requests():
+    async def run():
+        vision = FakeVision(detections_supported=False)
+        sensor = make_sensor(vision, poll_interval_s=0)
+        await asyncio.sleep(0.01)
+        readings = await sensor.get_readings()
+        await sensor.close()
+        return vision, readings
+
+    vision, readings = asyncio.run(run())
+    assert reading(readings) == (0, 1)
+    assert vision.calls == 0
@@ -0,0 +1,54 @@
+import asyncio
+
+from viam.services.vision import Vision
+
+from helpers import FakeVision, make_config, make_sensor, reading
+
+
+def test_concurrent_on_demand_readings_share_one_request():
+    async def run():
+        vision = FakeVision(delay=0.05)
+        sensor = make_sensor(vision, poll_interval_s=0)
+        results = await asyncio.gather(*(sensor.get_readings() for _ in range(5)))
+        await sensor.close()
+        return vision, results
+
+    vision, results = asyncio.run(run())
+    assert vision.calls == 1
+    assert all(reading(r) == (1, 0) for r in results)
+
+
+def test_reconfigure_discards_in_flight_result():
+    async def run():
+        old = FakeVision(label="person", delay=0.2)
+        new = FakeVision(label="cat")
+        sensor = make_sensor(old, poll_interval_s=0)
+        pending = asyncio.ensure_future(sensor.get_readings())
+        await asyncio.sleep(0.05)
+
+        sensor.reconfigure(make_config(poll_interval_s=0), {Vision.get_resource_name("vision"): new})
+        during = await pending
+        await asyncio.sleep(0.25)
+        after = await sensor.get_readings()
+        await sensor.close()
+        return old, during, after
+
+    old, during, after = asyncio.run(run())
+    assert old.cancelled == 1
+    assert reading(during) == (0, 1)
+    assert reading(after) == (0, 0)
+
+
+def test_request_is_not_shared_after_coalesce_window():
+    async def run():
+        vision = FakeVision(delay=0.2)
+        sensor = make_sensor(vision, poll_interval_s=0, coalesce_window_ms=20)
+        first = asyncio.ensure_future(sensor.get_readings())
+        await asyncio.sleep(0.05)
+        second = asyncio.ensure_future(sensor.get_readings())
+        await asyncio.gather(first, second)
+        await sensor.close()
+        return vision
+
+    vision = asyncio.run(run())
+    assert vision.calls == 2
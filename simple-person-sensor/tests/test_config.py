@@ -0,0 +1,30 @@
+import pytest
+
+from helpers import make_config
+from src.models.person_sensor import PersonSensor
+
+
+@pytest.mark.parametrize(
+    "attributes",
+    [
+        {"poll_interval_s": "0"},
+        {"poll_interval_s": -1},
+        {"cache_ms": -1},
+        {"max_stale_ms": 0},
+        {"default_timeout_ms": 0},
+        {"batch_tick_ms": float("inf")},
+    ],
+)
+def test_validate_config_rejects_bad_optional_attributes(attributes):
+    with pytest.raises(ValueError):
+        PersonSensor.validate_config(make_config(**attributes))
+
+
+def test_validate_config_rejects_missing_required_attribute():
+    with pytest.raises(ValueError):
+        PersonSensor.validate_config(make_config(camera_name=""))
+
+
+def test_validate_config_accepts_optional_attributes():
+    config = make_config(poll_interval_s=0, cache_ms=0, max_stale_ms=50, default_timeout_ms=500)
+    assert PersonSensor.validate_config(config) == ["vision", "cam"]
@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+from viam.proto.service.vision import Detection
+
+from helpers import FakeVision, make_sensor, reading
+from src.models.person_sensor import _contains_person
+
+
+class ExplodingDetection:
+    """A detection whose label must never be read, to check the person test stops early."""
+
+    @property
+    def class_name(self):
+        raise AssertionError("label read after a person was already found")
+
+
+@pytest.mark.parametrize(
+    "labels, expected",
+    [
+        (["person"], True),
+        (["dog", "Person"], True),
+        (["PERSON", "car"], True),
+        (["dog", "car"], False),
+        (["personal_item"], False),
+        ([], False),
+    ],
+)
+def test_contains_person(labels, expected):
+    assert _contains_person([Detection(class_name=label) for label in labels]) is expected
+
+
+def test_contains_person_stops_at_first_person():
+    assert _contains_person([Detection(class_name="person"), ExplodingDetection()])
+
+
+@pytest.mark.parametrize("label, expected", [("Person", (1, 0)), ("cat", (0, 0))])
+def test_readings_report_person_label(label, expected):
+    async def run():
+        sensor = make_sensor(FakeVision(label=label), poll_interval_s=0)
+        readings = await sensor.get_readings()
+        await sensor.close()
+        return readings
+
+    assert reading(asyncio.run(run())) == expected
@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from helpers import FakeVision, make_config, make_sensor, reading
+from src.models.person_sensor import PersonSensor
+
+
+def test_background_result_goes_stale_when_requests_fail():
+    async def run():
+        vision = FakeVision()
+        sensor = make_sensor(vision, poll_interval_s=0.02, max_stale_ms=100)
+        await asyncio.sleep(0.05)
+        fresh = await sensor.get_readings()
+        vision.error = RuntimeError("camera unavailable")
+        await asyncio.sleep(0.2)
+        stale = await sensor.get_readings()
+        await sensor.close()
+        return fresh, stale
+
+    fresh, stale = asyncio.run(run())
+    assert reading(fresh) == (1, 0)
+    assert reading(stale) == (0, 1)
+
+
+@pytest.mark.parametrize(
+    "attributes",
+    [
+        {"max_stale_ms": 50},
+        {"poll_interval_s": 2, "max_stale_ms": 1000},
+        {"poll_interval_s": 1, "max_stale_ms": 1500, "default_timeout_ms": 600},
+    ],
+)
+def test_validate_config_rejects_max_stale_within_poll_cycle(attributes):
+    with pytest.raises(ValueError):
+        PersonSensor.validate_config(make_config(**attributes))
+
+
+def test_slow_healthy_model_is_not_reported_stale_by_default():
+    async def run():
+        vision = FakeVision(delay=1.1)
+        sensor = make_sensor(vision, poll_interval_s=0.05)
+        await asyncio.sleep(1.2)
+        samples = []
+        for _ in range(30):
+            samples.append(reading(await sensor.get_readings()))
+            await asyncio.sleep(0.05)
+        await sensor.close()
+        return samples
+
+    samples = asyncio.run(run())
+    assert all(sample == (1, 0) for sample in samples)
@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+from helpers import FakeVision, make_sensor, reading
+
+
+def test_timed_out_request_reports_stale():
+    async def run():
+        vision = FakeVision(delay=10)
+        sensor = make_sensor(vision, poll_interval_s=0)
+        start = time.monotonic()
+        readings = await sensor.get_readings(timeout=0.05)
+        elapsed = time.monotonic() - start
+        await sensor.close()
+        return readings, elapsed
+
+    readings, elapsed = asyncio.run(run())
+    assert reading(readings) == (0, 1)
+    assert elapsed < 1
+
+
+def test_default_timeout_bounds_background_requests():
+    async def run():
+        vision = FakeVision(delay=10)
+        sensor = make_sensor(vision, poll_interval_s=0.01, default_timeout_ms=30, max_stale_ms=200)
+        await asyncio.sleep(0.15)
+        readings = await sensor.get_readings()
+        await sensor.close()
+        return vision, readings
+
+    vision, readings = asyncio.run(run())
+    assert vision.calls >= 2
+    assert vision.timeouts[0] == 0.03
+    assert vision.cancelled >= 1
+    assert reading(readings) == (0, 1)
+
+
+def test_background_requests_have_no_deadline_by_default():
+    async def run():
+        vision = FakeVision()
+        sensor = make_sensor(vision)
+        await asyncio.sleep(0.05)
+        await sensor.close()
+        return vision
+
+    vision = asyncio.run(run())
+    assert vision.timeouts and all(t is None for t in vision.timeouts)
+
+
+def test_joining_caller_keeps_its_own_timeout():
+    async def run():
+        vision = FakeVision(delay=3)
+        sensor = make_sensor(vision, poll_interval_s=0)
+        unbounded = asyncio.ensure_future(sensor.get_readings())
+        await asyncio.sleep(0.01)
+
+        start = time.monotonic()
+        readings = await sensor.get_readings(timeout=0.05)
+        elapsed = time.monotonic() - start
+
+        still_waiting = not unbounded.done()
+        await sensor.close()
+        await unbounded
+        return vision, readings, elapsed, still_waiting
+
+    vision, readings, elapsed, still_waiting = asyncio.run(run())
+    assert vision.calls == 1
+    assert reading(readings) == (0, 1)
+    assert elapsed < 1
+    assert still_waiting